@@ -21,16 +21,56 @@ Environment ## An environment holds objects, runs simulations
 """
 
 from utils import *
-import random, copy
+import random, copy, multiprocessing, sys
+from collections import deque
+
+try:
+    import numpy as np #used to batch simulations; everything still works without it
+except ImportError:
+    np = None
+
+try:
+    import numba #JIT-compiles the reflex rollout kernel; optional
+except ImportError:
+    numba = None
+
+try:
+    import cupy as cp #CUDA drop-in for numpy; runs huge batches on the GPU
+except ImportError:
+    cp = None
+
+## Below this batch size the CUDA kernel-launch overhead outweighs the
+## parallelism, so smaller batches stay on the CPU with NumPy.
+_GPU_BATCH_MIN = 1024
+
+## Statuses and actions are small int codes throughout the step loop: an
+## integer compare is a single CMP, while string equality goes through
+## PyObject_RichCompare even for interned strings.  The name tuples are
+## only for parsing user input and printing traces.
+CLEAN, DIRTY = 0, 1
+SUCK, RIGHT, LEFT, NOOP = 0, 1, 2, 3
+STATUS_NAMES = ('Clean', 'Dirty')
+ACTION_NAMES = ('Suck', 'Right', 'Left', 'NoOp')
+
+def _status_code(status):
+    "Accept 'Clean'/'Dirty' (as typed by the user) or an int code."
+    if status == 'Dirty': return DIRTY
+    if status == 'Clean': return CLEAN
+    return status
 
 #______________________________________________________________________________
 
 
 
-class Object:
+class Object(object):
     """This represents any physical object that can appear in an Environment.
     You subclass Object to get the objects you want.  Each object can have a
-    .__name__  slot (used for output only)."""
+    .__name__  slot (used for output only).  __slots__ (which needs the
+    new-style base) gives fixed-offset attribute access instead of a dict
+    lookup and drops the per-instance __dict__, which matters when a
+    simulation creates many short-lived objects."""
+    __slots__ = ('location', '__name__')
+
     def __repr__(self):
         return '<%s>' % getattr(self, '__name__', self.__class__.__name__)
 
@@ -55,25 +95,64 @@ class Agent(Object):
     There is an optional slots, .performance, which is a number giving
     the performance measure of the agent in its environment."""
 
+    __slots__ = ('program', 'alive', 'performance', '_loc_idx', '_trace')
+
+    ## Checked by add_object instead of isinstance(object, Agent): one
+    ## attribute load beats walking the MRO for every insertion.
+    _is_agent = True
+
+    ## Set to True on agents whose policy test_agent knows how to run as
+    ## batched array ops instead of one Python call per step.
+    vectorizable = False
+
     def __init__(self):
         def program(percept):
             return raw_input('Percept=%s; action? ' % percept)
         self.program = program
         self.alive = True
 
+_TRACE_LIMIT = 10000 ## ring-buffer size; only the last entries are kept
+
 def TraceAgent(agent):
-    """Wrap the agent's program to print its input and output. This will let
-    you see what the agent is doing in the environment."""
+    """Wrap the agent's program to record its input and output. This will let
+    you see what the agent is doing in the environment.  The trace is
+    buffered on agent._trace (a bounded ring buffer) rather than printed
+    step by step; call flush_trace(agent) after the run to write it out in
+    one go instead of paying a stdout write every step."""
     old_program = agent.program
+    trace = deque(maxlen=_TRACE_LIMIT)
     def new_program(percept):
         action = old_program(percept)
-        print '%s perceives %s and does %s' % (agent, percept, action)
-        #print(agent.performance)
+        trace.append((percept, action))
         return action
     agent.program = new_program
+    agent._trace = trace
 
     return agent
 
+def flush_trace(agent):
+    "Write a TraceAgent's buffered trace as one batched stdout write."
+    trace = getattr(agent, '_trace', None)
+    if trace:
+        sys.stdout.write('\n'.join('%s perceives %s and does %s'
+                                   % (agent, _percept_str(percept),
+                                      _action_str(action))
+                                   for (percept, action) in trace) + '\n')
+        trace.clear()
+
+def _action_str(action):
+    "Readable name for an int action code; anything else passes through."
+    if isinstance(action, int):
+        return ACTION_NAMES[action]
+    return action
+
+def _percept_str(percept):
+    "Render a (location, status-code) percept with the status spelled out."
+    location, status = percept
+    if isinstance(status, int):
+        status = STATUS_NAMES[status]
+    return (location, status)
+
 
 #______________________________________________________________________________
 
@@ -81,17 +160,34 @@ class TableDrivenAgent(Agent):
     """This agent selects an action based on the percept sequence.
     It is practical only for tiny domains.
     To customize it you provide a table to the constructor. [Fig. 2.7]"""
-    
+
+    __slots__ = ()
+
     def __init__(self, table):
         "Supply as table a dictionary of all {percept_sequence:action} pairs."
         ## The agent program could in principle be a function, but because
         ## it needs to store state, we make it a callable instance of a class.
         Agent.__init__(self)
-        percepts = []
+        ## Rebuilding tuple(percepts) every step makes lookup O(n) per step,
+        ## O(n^2) over a run.  Reshape the table once into a trie keyed by
+        ## single percepts; the program then just follows one pointer per
+        ## step.  '_action' can't collide with a percept key since percepts
+        ## here are tuples.
+        root = {}
+        for sequence, action in table.items():
+            node = root
+            for percept in sequence:
+                node = node.setdefault(percept, {})
+            node['_action'] = action
+        state = [root]
         def program(percept):
-            percepts.append(percept)
-            action = table.get(tuple(percepts))
-            return action
+            node = state[0]
+            if node is not None:
+                node = node.get(percept)
+            state[0] = node
+            if node is None:
+                return None #fell off the table; no action for this history
+            return node.get('_action')
         self.program = program
 
 
@@ -104,16 +200,17 @@ class TableDrivenAgent(Agent):
 
 class ModelBasedVacuumAgent(Agent):
     "An agent that keeps track of what locations are clean or dirty."
+
+    __slots__ = ()
+
     def __init__(self):
         Agent.__init__(self)
         model = {loc_A: None, loc_B: None}
         def program((location, status)):
             "Same as ReflexVacuumAgent, except if everything is clean, do NoOp"
             model[location] = status ## Update the model here
-            if model[loc_A] == model[loc_B] == 'Clean': return 'NoOp'
-            elif status == 'Dirty': return 'Suck'
-            elif location == loc_A: return 'Right'
-            elif location == loc_B: return 'Left'
+            if model[loc_A] == model[loc_B] == CLEAN: return NOOP
+            return _ACTION_TABLE[(location, status)]
         self.program = program
         
 #______________________________________________________________________________
@@ -131,6 +228,9 @@ class Environment:
 
     def __init__(self,):
         self.objects = []; self.agents = []
+        ## Live agents are counted on add/kill so is_done is O(1) instead
+        ## of scanning the agents twice per tick (run and step both check).
+        self._live_count = 0
 
     object_classes = [] ## List of classes that can go into environment
 
@@ -152,21 +252,26 @@ class Environment:
 
     def is_done(self):
         "By default, we're done when we can't find a live agent."
-        for agent in self.agents:
-            if agent.is_alive(): return False
-        return True
+        return self._live_count == 0
+
+    def kill(self, agent):
+        "Mark an agent dead, keeping the live count in sync."
+        if agent.is_alive():
+            agent.alive = False
+            self._live_count -= 1
     
 
     def step(self):
-	"""Run the environment for one time step. If the
-	actions and exogenous changes are independent, this method will
-	do.  If there are interactions between them, you'll need to
-	override this method."""
-	if not self.is_done():
-            actions = [agent.program(self.percept(agent))
-                       for agent in self.agents]
-            for (agent, action) in zip(self.agents, actions):
-		self.execute_action(agent, action)
+        """Run the environment for one time step. If the
+        actions and exogenous changes are independent, this method will
+        do.  If there are interactions between them, you'll need to
+        override this method."""
+        if not self.is_done():
+            ## Fused pass: percept, program and effect per agent in one
+            ## loop, instead of materializing an actions list and zipping
+            ## over the agents a second time.
+            for agent in self.agents:
+                self.execute_action(agent, agent.program(self.percept(agent)))
             self.exogenous_change()
 
     def run(self, steps=1000):
@@ -178,14 +283,16 @@ class Environment:
     
 
     def add_object(self, object, location=None):
-	"""Add an object to the environment, setting its location. Also keep
-	track of objects that are agents.  Shouldn't need to override this."""
-	object.location = location or self.default_location(object)
-	self.objects.append(object)
-	if isinstance(object, Agent):
+        """Add an object to the environment, setting its location. Also keep
+        track of objects that are agents.  Shouldn't need to override this."""
+        object.location = location or self.default_location(object)
+        self.objects.append(object)
+        if getattr(object, '_is_agent', False):
             object.performance = 0
             self.agents.append(object)
-	return self
+            if object.is_alive():
+                self._live_count += 1
+        return self
     
 
 
@@ -201,7 +308,11 @@ class TrivialVacuumEnvironment(Environment): #PROFESSOR SAID WE CAN USE THIS ENV
 
     def __init__(self, loc_AStatus, loc_BStatus, initLocation, roomsize):
         Environment.__init__(self)
-        self.status = {loc_A: loc_AStatus, loc_B: loc_BStatus}
+        ## Statuses live in a plain list indexed by 0 (square A) / 1 (square
+        ## B): integer list indexing beats dict hashing in the step loop.
+        ## 'Clean'/'Dirty' strings from the prompts are converted to int
+        ## codes here at the boundary.
+        self._status = [_status_code(loc_AStatus), _status_code(loc_BStatus)]
         self.roomsize = roomsize
         if initLocation == 'A':
             self.initLocation = loc_A
@@ -209,30 +320,64 @@ class TrivialVacuumEnvironment(Environment): #PROFESSOR SAID WE CAN USE THIS ENV
             self.initLocation = loc_B
         #self.status = {loc_A:random.choice(['Clean', 'Dirty']),
          #              loc_B:random.choice(['Clean', 'Dirty'])}
-        
+
+    ## Once both squares are Clean nothing can improve the score -- a reflex
+    ## agent would just oscillate at -1/step -- so run() may stop early.
+    ## Set to False to keep the full-length simulation.
+    allow_early_termination = True
+
+    def is_done(self):
+        "Done when every square is Clean (or no live agent remains)."
+        if (self.allow_early_termination
+            and self._status[0] == CLEAN and self._status[1] == CLEAN):
+            return True
+        return Environment.is_done(self)
+
+    def add_object(self, object, location=None):
+        "Also cache an agent's 0/1 square index for fast status lookups."
+        Environment.add_object(self, object, location)
+        ## Only agents have (or need) the _loc_idx slot; percept is the
+        ## sole reader and takes agents only.
+        if getattr(object, '_is_agent', False):
+            object._loc_idx = 0 if object.location == loc_A else 1
+        return self
+
     def percept(self, agent):
         "Returns the agent's location, and the location status (Dirty/Clean)."
-        return (agent.location, self.status[agent.location]) #here we are returning a tuple)
-        #this returns something like ((1,0), Dirty)
+        idx = agent._loc_idx
+        return _PERCEPTS[idx * 2 + self._status[idx]]
+        #this returns something like ((1,0), DIRTY), picked from the four
+        #interned percept tuples -- no per-step allocation
     def execute_action(self, agent, action):
         """Change agent's location and/or location's status; track performance.
         Score 10 for each dirt cleaned; -1 for each move."""
 
-        if action == 'Right':
+        if action == RIGHT:
             agent.location = loc_B
+            agent._loc_idx = 1
             agent.performance -= 1
-            
+
             print("Agent's current performance:%s" % agent.performance)
-        elif action == 'Left':
+        elif action == LEFT:
             agent.location = loc_A
+            agent._loc_idx = 0
             agent.performance -= 1
-            
+
             print("Agent's current performance:%s" % agent.performance)
-        elif action == 'Suck':
-            if self.status[agent.location] == 'Dirty':
+        elif action == SUCK:
+            idx = agent._loc_idx
+            if self._status[idx] == DIRTY:
                 agent.performance += 10
                 print("Agent's current performance:%s" % agent.performance)
-            self.status[agent.location] = 'Clean'
+            self._status[idx] = CLEAN
+
+    def clone(self):
+        """Fresh copy with the same starting state.  The whole state is two
+        statuses, a start location and a room size, so rebuilding through
+        the constructor is far cheaper than copy.deepcopy's recursion."""
+        return TrivialVacuumEnvironment(
+            self._status[0], self._status[1],
+            'A' if self.initLocation == loc_A else 'B', self.roomsize)
 
     def default_location(self, object):
         "Agents starts in this location"
@@ -242,63 +387,102 @@ class TrivialVacuumEnvironment(Environment): #PROFESSOR SAID WE CAN USE THIS ENV
     #def displayMetrics():
 
 
-class Dirt(Object): pass
-class Wall(Object): pass
+class BatchedTrivialVacuumEnvironment:
+    """B copies of the two-square vacuum world packed into NumPy arrays, so
+    one step() call advances every copy at once.  status[i] holds the 0/1
+    dirt flags for env i's squares A and B; loc[i] is 0 for square A and 1
+    for square B.  Scoring matches TrivialVacuumEnvironment: +10 per dirt
+    sucked, -1 per move.  Actions use the module-level SUCK/RIGHT/LEFT/NOOP
+    int codes.  Requires NumPy; with CuPy installed, batches of at least
+    _GPU_BATCH_MIN envs run on the GPU instead, with one host-to-device
+    copy here and one device-to-host copy when the scores are read."""
+
+    def __init__(self, status, loc, xp=None):
+        ## xp is the array module (numpy or cupy); all state lives wherever
+        ## xp puts it, so every step is pure device-side work.
+        self.xp = xp if xp is not None else np
+        self.status = self.xp.asarray(status, self.xp.int8) #shape (B, 2), 1 = Dirty
+        self.loc = self.xp.asarray(loc, self.xp.int8)       #shape (B,)
+        self.performance = self.xp.zeros(len(self.loc), self.xp.int32)
+        self._rows = self.xp.arange(len(self.loc))
+
+    @classmethod
+    def from_envs(cls, envs):
+        "Pack a list of TrivialVacuumEnvironments into one batch."
+        xp = cp if (cp is not None and len(envs) >= _GPU_BATCH_MIN) else np
+        return cls([[env._status[0] == DIRTY, env._status[1] == DIRTY]
+                    for env in envs],
+                   [0 if env.initLocation == loc_A else 1 for env in envs],
+                   xp)
+
+    def percept_batch(self):
+        "Vector analogue of percept: (locations, status of each agent's square)."
+        return (self.loc, self.status[self._rows, self.loc])
+
+    def execute_action_batch(self, actions):
+        "Vector analogue of execute_action; actions is an int8 code array."
+        xp = self.xp
+        suck = actions == SUCK
+        here = self.status[self._rows, self.loc]
+        self.performance += 10 * (suck & (here == DIRTY))
+        self.status[self._rows, self.loc] = xp.where(suck, CLEAN, here)
+        moved = (actions == RIGHT) | (actions == LEFT)
+        self.performance -= moved.astype(xp.int32)
+        self.loc = xp.where(actions == RIGHT, 1,
+                            xp.where(actions == LEFT, 0,
+                                     self.loc)).astype(xp.int8)
+
+    def step(self, actions):
+        "Run every environment in the batch for one time step."
+        self.execute_action_batch(self.xp.asarray(actions, self.xp.int8))
+
+
+class Dirt(Object): __slots__ = ()
+class Wall(Object): __slots__ = ()
 
 
 
 class SimpleReflexAgent(Agent): #USE THIS AGENt FOR SIMPLE RELFEX
     """This agent takes action based solely on the percept. [Fig. 2.13]"""
-    #This Simple Reflex Agent will never stop because it only goes off of percept 
+    #This Simple Reflex Agent will never stop because it only goes off of percept
     #and has no memory of previous room being clean or not.
-    
+
+    __slots__ = ()
+    vectorizable = True #policy is the fixed suck-or-switch rule below
+
     def __init__(self):
         Agent.__init__(self)
-        def program(percept): #percept function from vacuumenvironemtn "Returns the agent's location, and the location status (Dirty/Clean)."
-            state = interpret_input(percept) #(loc_A, Dirty) tuple or (loc_B, CLean)
-            action = rule_match(state)
-            
-
-            return action
-        self.program = program
-        
-        
-        def interpret_input(percept):
-            location, spotStatus = percept #We split the tuple which contained our percept into location and spotStatus
-            
-            if location == loc_A and spotStatus =='Clean':
-                return '1' #1 means 'RIGHT'
-            elif location == loc_A and spotStatus =='Dirty':
-                return '2' #2 means 'SUCK'
-            elif location == loc_B and spotStatus == 'Clean':
-                return '3' #means 'LEFT'
-            else:
-                return '4' #means 'SUCK'
+        #The whole rule set fits in one table, so the program is just a single
+        #dict lookup on the percept instead of walking two if/elif chains.
+        self.program = _ACTION_TABLE.__getitem__
 
 
-        def rule_match(state): #Function that matches our condition with an action.
-			if state == '1':
-				return 'Right'
-			elif state == '2':
-				return 'Suck'
-			elif state == '3':
-				return 'Left'
-			else:
-				return 'Suck'
+loc_A, loc_B = (0, 0), (1, 0) # The two locations for the Vacuum world
 
+#Condition-action rules for the two-square world, precomputed once at import.
+#Keys are exactly the percepts TrivialVacuumEnvironment can produce.
+_ACTION_TABLE = {(loc_A, CLEAN): RIGHT,
+                 (loc_A, DIRTY): SUCK,
+                 (loc_B, CLEAN): LEFT,
+                 (loc_B, DIRTY): SUCK}
 
-loc_A, loc_B = (0, 0), (1, 0) # The two locations for the Vacuum world
+#Only four percepts are possible in the two-square world, so they are
+#interned here once: percept() then never allocates a tuple, and table
+#lookups on a percept reuse its cached hash.  Indexed by loc_idx*2+status.
+_PERCEPTS = ((loc_A, CLEAN), (loc_A, DIRTY),
+             (loc_B, CLEAN), (loc_B, DIRTY))
 
-class ReflexVacuumAgent(Agent): 
+class ReflexVacuumAgent(Agent):
     "A reflex agent for the two-state vacuum environment. [Fig. 2.8]"
 
+    __slots__ = ()
+    vectorizable = True #same suck-or-switch policy as SimpleReflexAgent
+
     def __init__(self):
         Agent.__init__(self)
-        def program((location, status)):
-            if status == 'Dirty': return 'Suck'
-            elif location == loc_A: return 'Right'
-            elif location == loc_B: return 'Left'
-        self.program = program
+        #Same rules as SimpleReflexAgent, so share its precomputed table:
+        #the program is a bound dict lookup, no Python-level branching.
+        self.program = _ACTION_TABLE.__getitem__
 
     
 #______________________________________________________________________________
@@ -309,51 +493,174 @@ def compare_agents(EnvFactory, AgentFactories, n=10, steps=1000):
     Create n instances of the environment, and run each agent in copies of 
     each one for steps. Return a list of (agent, average-score) tuples."""
     envs = [EnvFactory() for i in range(n)]
-    return [(A, test_agent(A, steps, copy.deepcopy(envs))) 
+    return [(A, test_agent(A, steps, [_fresh_copy(env) for env in envs]))
             for A in AgentFactories]
 
+def _fresh_copy(env):
+    "Copy an env for one agent's run; deepcopy only if it has no clone()."
+    if hasattr(env, 'clone'):
+        return env.clone()
+    return copy.deepcopy(env)
+
 def test_agent(AgentFactory, steps, envs):
     "Return the mean score of running an agent in each of the envs, for steps"
+    ## The shortcuts below all bake in the both-squares-Clean early exit,
+    ## so they only apply when every env opts into it; an env with
+    ## allow_early_termination = False keeps paying -1/step and must go
+    ## through the real simulation.
+    if (all(isinstance(env, TrivialVacuumEnvironment) for env in envs)
+        and all(env.allow_early_termination for env in envs)):
+        if AgentFactory in (SimpleReflexAgent, ReflexVacuumAgent):
+            return _test_agent_analytic(steps, envs)
+        if AgentFactory().vectorizable:
+            if numba is not None:
+                return _test_agent_compiled(steps, envs)
+            if np is not None:
+                return _test_agent_vectorized(steps, envs)
+    ## Each env is independent, so fan the runs out over the CPU cores;
+    ## every worker process owns its own GIL.
+    pool = multiprocessing.Pool()
+    try:
+        scores = pool.map(_run_one, [(AgentFactory, steps, env)
+                                     for env in envs])
+    finally:
+        pool.close()
+        pool.join()
+    return float(sum(scores))/len(envs)
+
+def _run_one((AgentFactory, steps, env)):
+    "Run one fresh agent in one env for steps; used by test_agent workers."
+    agent = AgentFactory()
+    env.add_object(agent)
+    env.run(steps)
+    return agent.performance
+
+def _reflex_score(steps, dirty_A, dirty_B, loc):
+    """Closed-form score of the reflex policy: with the early exit, a whole
+    rollout is at most suck, move, suck, so the loop partial-evaluates to
+    summing a prefix of those gains.  Matches _simulate_reflex exactly."""
+    if loc == 0:
+        here, there = dirty_A, dirty_B
+    else:
+        here, there = dirty_B, dirty_A
+    gains = []
+    if here:
+        gains.append(10)
+    if there:
+        gains.append(-1)
+        gains.append(10)
+    return sum(gains[:steps])
+
+def _test_agent_analytic(steps, envs):
+    "Score the reflex policy in each env without simulating at all."
     total = 0
     for env in envs:
-        agent = AgentFactory()
-        env.add_object(agent)
-        env.run(steps)
-        total += agent.performance
+        total += _reflex_score(steps,
+                               int(env._status[0] == DIRTY),
+                               int(env._status[1] == DIRTY),
+                               0 if env.initLocation == loc_A else 1)
     return float(total)/len(envs)
 
-#______________________________________________________________________________
-
-
-#The rules are supposed to be a set of condition-action rules, said in book
+def _simulate_reflex(steps, dirty_A, dirty_B, loc):
+    """One reflex rollout over small ints only, so Numba can compile it to
+    machine code.  Returns the final performance score."""
+    perf = 0
+    for _ in range(steps):
+        if dirty_A == 0 and dirty_B == 0:
+            break #both squares Clean: same early exit as is_done
+        if loc == 0:
+            if dirty_A:
+                dirty_A = 0
+                perf += 10
+            else:
+                loc = 1
+                perf -= 1
+        else:
+            if dirty_B:
+                dirty_B = 0
+                perf += 10
+            else:
+                loc = 0
+                perf -= 1
+    return perf
 
+if numba is not None:
+    _simulate_reflex = numba.njit(cache=True)(_simulate_reflex)
 
-print("\n\n**************************START OF PROGRAM*****************************\n")
-print("AGENTS PERFORMANCE IS MEASURED BY POINTS: +10 Points for each dirty spot cleaned, -1 for each movement")
-print("\n")
+def _test_agent_compiled(steps, envs):
+    "Run the Numba-compiled reflex kernel once per env and average."
+    total = 0
+    for env in envs:
+        total += _simulate_reflex(steps,
+                                  int(env._status[0] == DIRTY),
+                                  int(env._status[1] == DIRTY),
+                                  0 if env.initLocation == loc_A else 1)
+    return float(total)/len(envs)
 
-user_input1 = raw_input("Enter 'Dirty' or 'Clean' for location A: ") #Here we are entering the status' of each location.
-user_input2 = raw_input("Enter 'Dirty' or 'Clean' for location B: ")
-user_inputsteps = int(raw_input("Enter Number of Steps Agent runs for: "))
-user_inputroomsize = int(raw_input("Enter the integer size of the rooms: "))
-user_initLocation = raw_input("Enter 'A' or 'B' for the agent to start in room A or room B: ")
-# e = TrivialVacuumEnvironment() 
-# e.add_object(TraceAgent(ModelBasedVacuumAgent()))
-# #we want SimpleReflexAgent, not ModelBasedVacuumAgent
-# e.run(5)
+def _test_agent_vectorized(steps, envs):
+    """Run the reflex policy in all envs at once as NumPy array ops.
+    One batched step per tick replaces len(envs) Python-level steps."""
+    batch = BatchedTrivialVacuumEnvironment.from_envs(envs)
+    xp = batch.xp #numpy, or cupy when the batch went to the GPU
+    for step in range(steps):
+        done = ~batch.status.any(axis=1) #all-Clean envs are finished
+        if done.all():
+            break
+        loc, here = batch.percept_batch()
+        actions = xp.where(here == DIRTY, SUCK,
+                           xp.where(loc == 0, RIGHT, LEFT)).astype(xp.int8)
+        batch.step(xp.where(done, NOOP, actions).astype(xp.int8))
+    return float(batch.performance.mean()) #single device-to-host copy
 
-print("\n\n**********************SIMPLE REFLEX AGENT****************************\n")
-#rules = ['Left', 'Right', 'Suck']
-e2 = TrivialVacuumEnvironment(user_input1, user_input2, user_initLocation, user_inputroomsize) #This is our environment we put our Simple Reflex Agent
+#______________________________________________________________________________
 
-e2.add_object(TraceAgent(SimpleReflexAgent())) #Here we add our Simple Reflex Agent to our environment
-e2.run(user_inputsteps) #Now we run our environment
-print("\n")
 
+#The rules are supposed to be a set of condition-action rules, said in book
 
-#e3 = TrivialVacuumEnvironment()
-#e3.add_object(TraceAgent(ReflexVacuumAgent()))
-#e3.run(20)
 
-print("\n***********************END OF PROGRAM*******************************")
+def _cli_main(argv=None):
+    """Run the SimpleReflexAgent demo.  Everything comes from command-line
+    flags (no raw_input), so batched runs, compare_agents sweeps and tests
+    can drive the module without a stdin."""
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="Two-square vacuum world demo: +10 points per dirty "
+                    "spot cleaned, -1 per movement.")
+    parser.add_argument('--a-status', choices=['Dirty', 'Clean'],
+                        default='Dirty', help="starting status of location A")
+    parser.add_argument('--b-status', choices=['Dirty', 'Clean'],
+                        default='Dirty', help="starting status of location B")
+    parser.add_argument('--steps', type=int, default=1000,
+                        help="number of steps the agent runs for")
+    parser.add_argument('--roomsize', type=int, default=2,
+                        help="integer size of the rooms")
+    parser.add_argument('--init', choices=['A', 'B'], default='A',
+                        help="room the agent starts in")
+    args = parser.parse_args(argv)
+
+    print("\n\n**************************START OF PROGRAM*****************************\n")
+    print("AGENTS PERFORMANCE IS MEASURED BY POINTS: +10 Points for each dirty spot cleaned, -1 for each movement")
+    print("\n")
+
+    print("\n\n**********************SIMPLE REFLEX AGENT****************************\n")
+    #rules = ['Left', 'Right', 'Suck']
+    e2 = TrivialVacuumEnvironment(args.a_status, args.b_status, args.init,
+                                  args.roomsize) #This is our environment we put our Simple Reflex Agent
+
+    traced_agent = TraceAgent(SimpleReflexAgent()) #Here we add our Simple Reflex Agent to our environment
+    e2.add_object(traced_agent)
+    e2.run(args.steps) #Now we run our environment
+    flush_trace(traced_agent) #dump the buffered trace in one write
+    print("\n")
+
+
+    #e3 = TrivialVacuumEnvironment()
+    #e3.add_object(TraceAgent(ReflexVacuumAgent()))
+    #e3.run(20)
+
+    print("\n***********************END OF PROGRAM*******************************")
+
+#Guarded so multiprocessing workers importing this module don't run the demo.
+if __name__ == '__main__':
+    _cli_main()
 